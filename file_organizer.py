@@ -4,9 +4,14 @@ Enhanced File Organizer - Professional GUI with advanced features
 """
 
 import os
+import sys
+import atexit
+import argparse
+import errno
 import shutil
 from pathlib import Path
 import logging
+import logging.handlers
 from datetime import datetime, timedelta
 import json
 import threading
@@ -15,32 +20,39 @@ import hashlib
 import re
 import time
 import sqlite3
-from collections import defaultdict
+from collections import defaultdict, deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
-# Optional GUI imports (loaded when GUI is used)
-try:
-    import tkinter as tk
-    from tkinter import filedialog, messagebox
-    from tkinter import ttk
-    from tkinter.scrolledtext import ScrolledText
-    import tkinter.font as tkFont
-except Exception:
-    tk = None
+# Format version recorded in the undo log header line
+UNDO_LOG_VERSION = 2
 
-# Optional advanced imports
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# Background thread writing log records; started once by SimpleFileOrganizer.setup_logging()
+_log_listener = None
+
+# Optional GUI imports (loaded by _load_tkinter() when the GUI is used)
+tk = None
+filedialog = messagebox = ttk = ScrolledText = tkFont = None
 
+# Optional GUI extras; both load Tkinter themselves, so _load_tkinter() imports them too
+plt = FigureCanvasTkAgg = None
+MATPLOTLIB_AVAILABLE = False
+TkinterDnD = DND_FILES = None
+DND_AVAILABLE = False
+
+# Optional advanced imports
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
@@ -50,39 +62,82 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
-try:
-    from tkinterdnd2 import TkinterDnD, DND_FILES
-    TkinterDnD = TkinterDnD
-    DND_AVAILABLE = True
-except ImportError:
-    TkinterDnD = None
-    DND_AVAILABLE = False
+def _load_tkinter():
+    """Import Tkinter on first use so CLI runs skip it; return whether it is available."""
+    global tk, filedialog, messagebox, ttk, ScrolledText, tkFont
+    global plt, FigureCanvasTkAgg, MATPLOTLIB_AVAILABLE, TkinterDnD, DND_FILES, DND_AVAILABLE
+    if tk is None:
+        try:
+            import tkinter as tk
+            from tkinter import filedialog, messagebox
+            from tkinter import ttk
+            from tkinter.scrolledtext import ScrolledText
+            import tkinter.font as tkFont
+        except Exception:
+            tk = None
+            return False
+        
+        try:
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            MATPLOTLIB_AVAILABLE = True
+        except ImportError:
+            MATPLOTLIB_AVAILABLE = False
+        
+        try:
+            from tkinterdnd2 import TkinterDnD, DND_FILES
+            DND_AVAILABLE = True
+        except ImportError:
+            DND_AVAILABLE = False
+    return True
+
+
+# Extracts the count from "N suspicious files detected" log lines
+_SUSPICIOUS_COUNT_RE = re.compile(r'(\d+)\s+suspicious')
+
+
+def _name_suffix(name):
+    """Return a file name's suffix with Path.suffix semantics (a trailing "." is no suffix)."""
+    ext = os.path.splitext(name)[1]
+    return ext if len(ext) > 1 else ''
+
+
+# Windows and macOS filesystems are case-insensitive by default, so names that differ
+# only in case collide there; elsewhere they are distinct files
+_fs_name_key = str.casefold if os.name == 'nt' or sys.platform == 'darwin' else str
 
 
 class SimpleFileOrganizer:
     """Enhanced file organizer with advanced analytics and duplicate detection."""
     
-    def __init__(self, target_directory):
+    def __init__(self, target_directory, enable_logging=True):
         """Initialize with target directory and analytics database."""
-        self.target_directory = Path(target_directory)
-        self.setup_logging("INFO")
+        # Resolved once (symlinks included); the str form is what the os.* calls in the hot paths use
+        self.target_dir_str = os.path.realpath(os.fspath(target_directory))
+        self.target_directory = Path(self.target_dir_str)
+        if enable_logging:
+            self.setup_logging("INFO")
+        else:
+            # No log file or handlers; warnings still reach stderr via logging's fallback
+            self.logger = logging.getLogger(__name__)
         self.setup_database()
         
         # Enhanced file categories with more types
         self.default_categories = {
-            "Documents": {'.pdf', '.doc', '.docx', '.txt', '.rtf', '.xls', '.xlsx', '.ppt', '.pptx', '.csv', '.odt', '.ods'},
-            "Images": {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg', '.webp', '.ico', '.raw', '.psd'},
-            "Videos": {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.mpg', '.mpeg', '.m4v', '.3gp'},
-            "Audio": {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a', '.opus', '.aiff'},
-            "Archives": {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.cab', '.deb', '.rpm'},
-            "Code": {'.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go', '.rs', '.ts', '.jsx', '.vue'},
-            "Executables": {'.exe', '.msi', '.deb', '.rpm', '.dmg', '.pkg', '.app', '.run'},
-            "Fonts": {'.ttf', '.otf', '.woff', '.woff2', '.eot'},
-            "Data": {'.json', '.xml', '.yaml', '.yml', '.sql', '.db', '.sqlite'}
+            "Documents": frozenset({'.pdf', '.doc', '.docx', '.txt', '.rtf', '.xls', '.xlsx', '.ppt', '.pptx', '.csv', '.odt', '.ods'}),
+            "Images": frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.svg', '.webp', '.ico', '.raw', '.psd'}),
+            "Videos": frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.mpg', '.mpeg', '.m4v', '.3gp'}),
+            "Audio": frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a', '.opus', '.aiff'}),
+            "Archives": frozenset({'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.cab', '.deb', '.rpm'}),
+            "Code": frozenset({'.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go', '.rs', '.ts', '.jsx', '.vue'}),
+            "Executables": frozenset({'.exe', '.msi', '.deb', '.rpm', '.dmg', '.pkg', '.app', '.run'}),
+            "Fonts": frozenset({'.ttf', '.otf', '.woff', '.woff2', '.eot'}),
+            "Data": frozenset({'.json', '.xml', '.yaml', '.yml', '.sql', '.db', '.sqlite'})
         }
         
         # Load custom categories
         self.file_categories = self.load_custom_categories()
+        self._build_extension_index()
         
         # Suspicious file patterns for malware detection
         self.suspicious_patterns = [
@@ -94,11 +149,13 @@ class SimpleFileOrganizer:
         ]
         
         self.stats = {"moved": 0, "errors": 0, "suspicious": 0, "duplicates": 0, "space_saved": 0}
-        self.undo_data = []
-        self.undo_file = self.target_directory / ".file_organizer_undo.json"
+        self.undo_file = self.target_directory / ".file_organizer_undo.jsonl"
+        self.legacy_undo_file = self.target_directory / ".file_organizer_undo.json"
+        self._undo_log = None
         self.suspicious_files = []
         self.duplicate_files = []
         self.organization_report = None
+        self.file_statistics = {}
 
     def setup_database(self):
         """Set up SQLite database for analytics and history."""
@@ -157,18 +214,30 @@ class SimpleFileOrganizer:
 
     def setup_logging(self, log_level: str = "INFO"):
         """Set up logging configuration."""
+        global _log_listener
+        self.logger = logging.getLogger(__name__)
+        if _log_listener is not None:
+            # Already configured by an earlier instance in this process
+            return
+        
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
-        log_filename = log_dir / f"file_organizer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper(), logging.INFO),
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        log_filename = log_dir / f"file_organizer_{time.strftime('%Y%m%d_%H%M%S')}.log"
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_filename)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; file and console writes happen on the listener thread
+        log_queue = queue.SimpleQueue()
+        root_logger = logging.getLogger()
+        root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        
         self.logger.info(f"File Organizer initialized. Log file: {log_filename}")
 
     def load_custom_categories(self):
@@ -180,13 +249,26 @@ class SimpleFileOrganizer:
                 cursor = self.db_connection.cursor()
                 cursor.execute("SELECT name, extensions FROM custom_categories")
                 for name, extensions_str in cursor.fetchall():
-                    extensions = set(ext.strip() for ext in extensions_str.split(','))
-                    categories[name] = extensions
+                    categories[name] = frozenset(ext.strip().lower() for ext in extensions_str.split(','))
             except Exception as e:
                 self.logger.error(f"Failed to load custom categories: {e}")
         
         return categories
 
+    def _build_extension_index(self):
+        """Invert file_categories into a read-only extension -> category mapping for O(1) lookups."""
+        index = {}
+        for category, extensions in self.file_categories.items():
+            for ext in extensions:
+                # First category listing an extension wins, as with the old linear scan.
+                # Extensions are stored lowercase, matching the lookup in get_file_category.
+                index.setdefault(sys.intern(ext), category)
+        self._ext_to_category = MappingProxyType(index)
+        # Suffix lengths that can possibly match, for cheap rejection of unknown extensions
+        self._ext_lengths = frozenset(len(ext) for ext in index)
+        # Raw suffix -> category answers from get_file_category; stale once the index changes
+        self._suffix_cache = {}
+
     def save_custom_category(self, name, extensions):
         """Save a custom category to database."""
         if not self.db_connection:
@@ -202,12 +284,32 @@ class SimpleFileOrganizer:
             self.db_connection.commit()
             
             # Update in-memory categories
-            self.file_categories[name] = extensions
+            self.file_categories[name] = frozenset(ext.lower() for ext in extensions)
+            self._build_extension_index()
             return True
         except Exception as e:
             self.logger.error(f"Failed to save custom category: {e}")
             return False
 
+    def delete_custom_category(self, name):
+        """Delete a custom category from database."""
+        if not self.db_connection:
+            return False
+        
+        try:
+            cursor = self.db_connection.cursor()
+            cursor.execute("DELETE FROM custom_categories WHERE name = ?", (name,))
+            self.db_connection.commit()
+            
+            # Update in-memory categories
+            if name in self.file_categories:
+                del self.file_categories[name]
+                self._build_extension_index()
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to delete custom category: {e}")
+            return False
+
     def calculate_file_hash(self, file_path, chunk_size=8192):
         """Calculate MD5 hash of a file."""
         try:
@@ -220,17 +322,30 @@ class SimpleFileOrganizer:
             return None
 
     def find_duplicates(self, files, progress_callback=None):
-        """Find duplicate files using hash comparison."""
+        """Find duplicate files using hash comparison.
+
+        Files are bucketed by size first and only sizes shared by two or more
+        files are hashed, since files of different sizes cannot be duplicates.
+        """
         if not files:
             return
         
         print("🔍 Scanning for duplicate files...")
+        size_buckets = defaultdict(list)
+        for file_path in files:
+            try:
+                size_buckets[file_path.stat().st_size].append(file_path)
+            except Exception as e:
+                self.logger.warning("Failed to stat %s: %s", file_path.name, e)
+        
+        # Buckets keep the input order, so the first file of each duplicate set is kept
+        candidates = [f for bucket in size_buckets.values() if len(bucket) > 1 for f in bucket]
         hash_to_files = defaultdict(list)
         
-        for i, file_path in enumerate(files):
+        for i, file_path in enumerate(candidates):
             if progress_callback:
                 try:
-                    progress_callback(i + 1, len(files), f"Scanning: {file_path.name}")
+                    progress_callback(i + 1, len(candidates), f"Scanning: {file_path.name}")
                 except Exception:
                     pass
             
@@ -239,7 +354,7 @@ class SimpleFileOrganizer:
                 if file_hash:
                     hash_to_files[file_hash].append(file_path)
             except Exception as e:
-                self.logger.warning(f"Failed to hash {file_path.name}: {e}")
+                self.logger.warning("Failed to hash %s: %s", file_path.name, e)
         
         # Find duplicates (files with same hash)
         duplicates = []
@@ -287,7 +402,7 @@ class SimpleFileOrganizer:
                 file_dates.append((file_path, mod_time))
                 
                 # Type distribution
-                ext = file_path.suffix.lower()
+                ext = _name_suffix(file_path.name).lower()
                 stats['type_distribution'][ext] += 1
                 
                 # Size distribution
@@ -312,7 +427,7 @@ class SimpleFileOrganizer:
                     stats['date_distribution']['Older'] += 1
                     
             except Exception as e:
-                self.logger.warning(f"Failed to get stats for {file_path.name}: {e}")
+                self.logger.warning("Failed to get stats for %s: %s", file_path.name, e)
         
         # Sort and get top files
         file_sizes.sort(key=lambda x: x[1], reverse=True)
@@ -328,11 +443,11 @@ class SimpleFileOrganizer:
         """Generate comprehensive organization report."""
         report = {
             'timestamp': datetime.now().isoformat(),
-            'target_directory': str(self.target_directory),
+            'target_directory': self.target_dir_str,
             'statistics': self.stats,
             'file_statistics': file_stats,
-            'suspicious_files': [str(f) for f in self.suspicious_files],
-            'duplicate_files': [str(f) for f in self.duplicate_files],
+            'suspicious_files': [os.fspath(f) for f in self.suspicious_files],
+            'duplicate_files': [os.fspath(f) for f in self.duplicate_files],
             'organization_summary': {
                 'total_files_processed': file_stats['total_files'],
                 'files_moved': self.stats['moved'],
@@ -360,7 +475,7 @@ class SimpleFileOrganizer:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 datetime.now().isoformat(),
-                str(self.target_directory),
+                self.target_dir_str,
                 organization_type,
                 self.stats['moved'],
                 self.stats['duplicates'],
@@ -501,6 +616,7 @@ class SimpleFileOrganizer:
     def detect_suspicious_file(self, file_path):
         """Detect potentially suspicious/malware files."""
         filename = file_path.name.lower()
+        suffix = _name_suffix(filename)
         
         # Check against suspicious patterns
         for pattern in self.suspicious_patterns:
@@ -508,7 +624,7 @@ class SimpleFileOrganizer:
                 return True
         
         # Check file size (very small executables might be suspicious)
-        if file_path.suffix.lower() in {'.exe', '.com', '.bat', '.cmd', '.scr'}:
+        if suffix in {'.exe', '.com', '.bat', '.cmd', '.scr'}:
             try:
                 if file_path.stat().st_size < 1024:  # Less than 1KB
                     return True
@@ -516,7 +632,7 @@ class SimpleFileOrganizer:
                 pass
         
         # Check for hidden files with executable extensions
-        if filename.startswith('.') and file_path.suffix.lower() in {'.exe', '.bat', '.cmd', '.sh'}:
+        if filename.startswith('.') and suffix in {'.exe', '.bat', '.cmd', '.sh'}:
             return True
             
         return False
@@ -524,11 +640,23 @@ class SimpleFileOrganizer:
     def get_file_category(self, file_path, organization_type="type"):
         """Get category for file based on organization type."""
         if organization_type == "type":
-            file_extension = file_path.suffix.lower()
-            for category, extensions in self.file_categories.items():
-                if file_extension in extensions:
-                    return category
-            return "Others"
+            raw_extension = _name_suffix(file_path.name)
+            # Suffixes repeat heavily, so remember the answer per raw (mixed-case) suffix
+            category = self._suffix_cache.get(raw_extension)
+            if category is not None:
+                return category
+            
+            file_extension = raw_extension
+            if len(file_extension) not in self._ext_lengths:
+                category = "Others"
+            else:
+                # Most suffixes are already lowercase; skip allocating a lowered copy for those
+                if not file_extension.islower():
+                    file_extension = file_extension.lower()
+                category = self._ext_to_category.get(file_extension, "Others")
+            if len(self._suffix_cache) < 1024:
+                self._suffix_cache[raw_extension] = category
+            return category
         
         elif organization_type == "date":
             try:
@@ -559,47 +687,106 @@ class SimpleFileOrganizer:
                 return "Unknown Size"
         
         elif organization_type == "extension":
-            ext = file_path.suffix.lower()
-            return ext[1:] if ext else "No Extension"
+            ext = _name_suffix(file_path.name)
+            if not ext:
+                return "No Extension"
+            return ext[1:] if ext.islower() else ext[1:].lower()
         
         return "Others"
 
-    def save_undo_data(self):
-        """Save undo data to JSON file."""
-        try:
-            undo_info = {
+    def _encode_undo_record(self, record):
+        """Serialize one undo record as a JSON Lines row."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(record) + b'\n'
+        return json.dumps(record).encode('utf-8') + b'\n'
+
+    def _append_undo_record(self, move_info):
+        """Append a move to the undo log, starting a fresh log on the first move of a run.
+
+        Rows only hold the original ("o") and new ("n") paths plus "s"/"d" flags for
+        suspicious and duplicate files; the rest is derived again by _expand_undo_record.
+        """
+        if self._undo_log is None:
+            self._undo_log = open(self.undo_file, 'wb', buffering=64 * 1024)
+            self._undo_log.write(self._encode_undo_record({
+                "version": UNDO_LOG_VERSION,
                 "timestamp": datetime.now().isoformat(),
-                "target_directory": str(self.target_directory),
-                "moves": self.undo_data,
-                "suspicious_files": [str(f) for f in self.suspicious_files]
-            }
-            with open(self.undo_file, 'w') as f:
-                json.dump(undo_info, f, indent=2)
-            self.logger.info(f"Undo data saved to {self.undo_file}")
-        except Exception as e:
-            self.logger.error(f"Failed to save undo data: {e}")
+                "target_directory": self.target_dir_str
+            }))
+        record = {"o": move_info["original_path"], "n": move_info["new_path"]}
+        if move_info.get("suspicious"):
+            record["s"] = 1
+        if move_info.get("duplicate"):
+            record["d"] = 1
+        self._undo_log.write(self._encode_undo_record(record))
+
+    def _expand_undo_record(self, record):
+        """Rebuild a full move entry from a compact undo log row."""
+        if "o" not in record:
+            # Written before rows were compacted
+            return record
+        original_path = record["o"]
+        new_path = record["n"]
+        return {
+            "original_path": original_path,
+            "new_path": new_path,
+            "filename": os.path.basename(original_path),
+            "category": os.path.basename(os.path.dirname(new_path)),
+            "suspicious": "s" in record,
+            "duplicate": "d" in record
+        }
 
-    def load_undo_data(self):
-        """Load undo data from JSON file."""
+    def _close_undo_log(self):
+        """Flush the undo log and sync it to disk once, at the end of a run."""
+        if self._undo_log is None:
+            return
         try:
-            if self.undo_file.exists():
-                with open(self.undo_file, 'r') as f:
-                    undo_info = json.load(f)
-                    self.undo_data = undo_info.get("moves", [])
-                    self.suspicious_files = [Path(f) for f in undo_info.get("suspicious_files", [])]
-                    self.logger.info(f"Loaded {len(self.undo_data)} undo entries")
-                    return True
+            self._undo_log.flush()
+            os.fsync(self._undo_log.fileno())
+            self.logger.info(f"Undo data saved to {self.undo_file}")
         except Exception as e:
-            self.logger.error(f"Failed to load undo data: {e}")
-        return False
+            self.logger.error(f"Failed to save undo data: {e}")
+        finally:
+            self._undo_log.close()
+            self._undo_log = None
+
+    def iter_undo_entries(self):
+        """Yield undo records one at a time from the undo log, or from a legacy JSON undo file."""
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        if self.undo_file.exists():
+            with open(self.undo_file, 'rb') as f:
+                f.readline()  # run header
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # A run that was cut short can leave a partial last line
+                        return
+                    yield self._expand_undo_record(record)
+        elif self.legacy_undo_file.exists():
+            with open(self.legacy_undo_file, 'rb') as f:
+                yield from loads(f.read()).get("moves", [])
+
+    def _count_undo_entries(self):
+        """Count undo records without parsing them; None when there is no undo data."""
+        if self.undo_file.exists():
+            count = 0
+            with open(self.undo_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(64 * 1024), b''):
+                    count += chunk.count(b'\n')
+            # Complete lines only, minus the run header
+            return max(count - 1, 0)
+        if self.legacy_undo_file.exists():
+            return sum(1 for _ in self.iter_undo_entries())
+        return None
 
     def clear_undo_data(self):
-        """Clear undo data and remove undo file."""
+        """Clear undo data and remove undo files."""
         try:
-            self.undo_data = []
             self.suspicious_files = []
-            if self.undo_file.exists():
-                self.undo_file.unlink()
+            for undo_file in (self.undo_file, self.legacy_undo_file):
+                if undo_file.exists():
+                    undo_file.unlink()
             self.logger.info("Undo data cleared")
         except Exception as e:
             self.logger.error(f"Failed to clear undo data: {e}")
@@ -619,101 +806,156 @@ class SimpleFileOrganizer:
             reverse = (sort_order == 'desc')
             sorted_files = sorted(files, key=key_func, reverse=reverse)
             
-            if hasattr(self, 'logger'):
-                self.logger.info(f"Files sorted by {sort_by} ({sort_order})")
+            self.logger.info("Files sorted by %s (%s)", sort_by, sort_order)
             
             return sorted_files
             
         except Exception as e:
-            if hasattr(self, 'logger'):
-                self.logger.warning(f"Error sorting files: {e}. Using original order.")
+            self.logger.warning("Error sorting files: %s. Using original order.", e)
             return files
 
-    def create_folders(self, organization_type="type"):
-        """Create category folders based on organization type."""
-        if organization_type == "type":
-            categories = list(self.file_categories.keys()) + ["Others", "Suspicious"]
-        elif organization_type == "date":
-            categories = ["This Week", "This Month", "This Year", "Older", "Unknown Date", "Suspicious"]
-        elif organization_type == "size":
-            categories = ["Small (< 1MB)", "Medium (1-10MB)", "Large (10-100MB)", "Very Large (> 100MB)", "Unknown Size", "Suspicious"]
-        elif organization_type == "extension":
-            categories = ["Suspicious"]  # Will create extension folders dynamically
-        
-        for category in categories:
-            folder_path = self.target_directory / category
-            folder_path.mkdir(exist_ok=True)
-            if hasattr(self, 'logger'):
-                self.logger.debug(f"Created/verified folder: {folder_path}")
-        
-        if hasattr(self, 'logger'):
-            self.logger.info("Category folders created/verified")
+    def _reserve_destination(self, category, filename):
+        """Return a free destination path (str) in a category folder, adding a numeric suffix on conflict.
+
+        The folder is created and listed the first time a run uses it; later checks
+        are set lookups. Names are compared case-insensitively only where the
+        filesystem is (Windows, macOS).
+        """
+        if not category:
+            raise ValueError(f"Empty destination category for {filename}")
+        names = self._dest_names.get(category)
+        if names is None:
+            folder = os.path.join(self.target_dir_str, category)
+            os.makedirs(folder, exist_ok=True)
+            with os.scandir(folder) as it:
+                names = self._dest_names[category] = {_fs_name_key(entry.name) for entry in it}
+            self._cat_dirs[category] = folder
+        
+        name = filename
+        key = _fs_name_key(filename)
+        if key in names:
+            suffix = _name_suffix(filename)
+            stem = filename[:len(filename) - len(suffix)]
+            # Resume from the last suffix handed out for this name, so K files that
+            # share a name cost O(K) probes in total rather than O(K^2)
+            counter = self._next_suffix.get((category, key), 1)
+            while _fs_name_key(f"{stem}_{counter}{suffix}") in names:
+                counter += 1
+            self._next_suffix[(category, key)] = counter + 1
+            name = f"{stem}_{counter}{suffix}"
+        names.add(_fs_name_key(name))
+        return os.path.join(self._cat_dirs[category], name)
+
+    def _move_file(self, src, dst):
+        """Move a file without overwriting dst, raising FileExistsError if it is taken.
+
+        os.rename refuses to overwrite on Windows but silently replaces dst on POSIX,
+        so there the file is hard-linked into place (which fails if dst exists) and
+        the old name removed. Filesystems without hard links fall back to rename,
+        and moves across filesystems to shutil.move.
+        """
+        if os.name != 'nt':
+            try:
+                os.link(src, dst, follow_symlinks=False)
+            except FileExistsError:
+                raise
+            except (NotImplementedError, OSError):
+                # No hard links here (EPERM, ENOTSUP, EXDEV, ...); use rename below
+                if os.path.lexists(dst):
+                    raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+            else:
+                try:
+                    os.unlink(src)
+                except OSError:
+                    os.unlink(dst)
+                    raise
+                return
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
+
+    def _try_move_file(self, src, dst):
+        """Run _move_file on a worker thread, returning the exception instead of raising it."""
+        try:
+            self._move_file(src, dst)
+        except Exception as e:
+            return e
+        return None
 
     def organize_files(self, dry_run=False, sort_by='name', sort_order='asc', organization_type="type", progress_callback=None, find_duplicates=True):
         """Organize files with enhanced features including duplicate detection."""
         self.start_time = time.time()
         
-        if hasattr(self, 'logger'):
-            self.logger.info(f"Starting file organization{' (DRY RUN)' if dry_run else ''}")
-            self.logger.info(f"Target directory: {self.target_directory}")
-            self.logger.info(f"Organization type: {organization_type}")
-            self.logger.info(f"Find duplicates: {find_duplicates}")
-        
-        if not self.target_directory.exists():
-            print(f"Error: Directory '{self.target_directory}' does not exist!")
-            return False
+        self.logger.info("Starting file organization%s", ' (DRY RUN)' if dry_run else '')
+        self.logger.info("Target directory: %s", self.target_directory)
+        self.logger.info("Organization type: %s", organization_type)
+        self.logger.info("Find duplicates: %s", find_duplicates)
         
         # Reset stats
         self.stats = {"moved": 0, "errors": 0, "suspicious": 0, "duplicates": 0, "space_saved": 0}
         self.suspicious_files = []
         self.duplicate_files = []
-        
-        # Get all files
-        files = [f for f in self.target_directory.iterdir() if f.is_file() and not f.name.startswith('.')]
+        self.file_statistics = {}
+        self._dest_names = {}
+        self._cat_dirs = {}
+        self._next_suffix = {}
+        
+        # Get all files with a single scandir pass; the DirEntry objects answer
+        # is_file() from the directory listing and cache their stat() result.
+        # A missing target surfaces here rather than through a separate probe.
+        try:
+            with os.scandir(self.target_dir_str) as it:
+                # Dotfiles (including the undo log) are skipped; scandir never yields empty names
+                files = [entry for entry in it if entry.name[0] != '.' and entry.is_file()]
+        except FileNotFoundError:
+            print(f"Error: Directory '{self.target_directory}' does not exist!")
+            return False
+        except NotADirectoryError:
+            print(f"Error: '{self.target_directory}' is not a directory!")
+            return False
         if not files:
             print("No files found to organize.")
             return True
         
-        # Generate file statistics
+        # Generate file statistics (kept for callers such as the GUI charts)
         file_stats = self.generate_file_statistics(files)
+        self.file_statistics = file_stats
         
         # Find duplicates if enabled
         if find_duplicates:
             print("🔍 Scanning for duplicates...")
+            # Also totals the space the duplicates take up into stats["space_saved"]
             self.find_duplicates(files, progress_callback)
-            
-            # Calculate space that would be saved by removing duplicates
-            for dup_file in self.duplicate_files:
-                try:
-                    self.stats["space_saved"] += dup_file.stat().st_size
-                except:
-                    pass
         
         # Sort files
         files = self._sort_files(files, sort_by, sort_order)
         
-        # Create folders
-        if not dry_run:
-            self.create_folders(organization_type)
-            if self.duplicate_files:
-                (self.target_directory / "Duplicates").mkdir(exist_ok=True)
+        # Category folders are created lazily, only for categories that receive files
         
         print(f"Found {len(files)} files to organize")
         if self.duplicate_files:
             print(f"🔍 {len(self.duplicate_files)} duplicate files found")
         print("-" * 60)
         
-        # Process each file
+        # Process each file: classify and reserve destinations in order, then
+        # hand the renames to a thread pool so their syscall latency overlaps
+        total = len(files)
+        plan = []
+        # DirEntry objects hash by identity, so set membership needs no stat or path comparison
+        duplicate_set = set(self.duplicate_files)
         for i, file_path in enumerate(files, 1):
-            if progress_callback:
+            if dry_run and progress_callback:
                 try:
-                    progress_callback(i, len(files), file_path.name)
+                    progress_callback(i, total, file_path.name)
                 except Exception:
                     pass
             
             try:
                 # Check if file is a duplicate
-                is_duplicate = file_path in self.duplicate_files
+                is_duplicate = file_path in duplicate_set
                 
                 # Check for suspicious files
                 is_suspicious = self.detect_suspicious_file(file_path)
@@ -727,46 +969,72 @@ class SimpleFileOrganizer:
                 else:
                     category = self.get_file_category(file_path, organization_type)
                 
-                # For extension-based organization, create folders dynamically
-                if organization_type == "extension" and not is_suspicious and not is_duplicate:
-                    category_path = self.target_directory / category
-                    if not dry_run:
-                        category_path.mkdir(exist_ok=True)
-                
-                destination = self.target_directory / category / file_path.name
-                
                 if dry_run:
                     status = "[SUSPICIOUS]" if is_suspicious else "[DUPLICATE]" if is_duplicate else "[DRY RUN]"
                     print(f"{status} {file_path.name} -> {category}/")
                 else:
                     # Handle name conflicts
-                    counter = 1
-                    original_dest = destination
-                    while destination.exists():
-                        name = f"{original_dest.stem}_{counter}{original_dest.suffix}"
-                        destination = original_dest.parent / name
-                        counter += 1
-                    
-                    # Move file
-                    shutil.move(str(file_path), str(destination))
-                    status = "[SUSPICIOUS]" if is_suspicious else "[DUPLICATE]" if is_duplicate else "Moved:"
-                    print(f"{status} {file_path.name} -> {category}/")
-                    
-                    # Track for undo
-                    self.undo_data.append({
-                        "original_path": str(file_path),
-                        "new_path": str(destination),
-                        "filename": file_path.name,
-                        "category": category,
-                        "suspicious": is_suspicious,
-                        "duplicate": is_duplicate
-                    })
-                    self.stats["moved"] += 1
+                    destination = self._reserve_destination(category, file_path.name)
+                    plan.append((file_path, destination, category, is_suspicious, is_duplicate))
                     
             except Exception as e:
                 print(f"Error moving {file_path.name}: {e}")
                 self.stats["errors"] += 1
         
+        if plan:
+            # Renames are submitted grouped by destination folder, so each folder's
+            # metadata is updated in one stretch. Results are still read back in plan
+            # order, so stats, undo data and progress are only touched from this thread.
+            by_category = {}
+            for index, entry in enumerate(plan):
+                by_category.setdefault(entry[2], []).append(index)
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [None] * len(plan)
+                    for indices in by_category.values():
+                        for index in indices:
+                            futures[index] = executor.submit(self._try_move_file, plan[index][0].path, plan[index][1])
+                    for i, (entry, future) in enumerate(zip(plan, futures), 1):
+                        error = future.result()
+                        file_path, destination, category, is_suspicious, is_duplicate = entry
+                        if progress_callback:
+                            try:
+                                progress_callback(i, total, file_path.name)
+                            except Exception:
+                                pass
+                        
+                        if isinstance(error, FileExistsError):
+                            # Something else took the name after the folder was listed;
+                            # _move_file refuses to overwrite it, so pick the next free one
+                            destination = self._reserve_destination(category, file_path.name)
+                            error = self._try_move_file(file_path.path, destination)
+                        
+                        if error is not None:
+                            print(f"Error moving {file_path.name}: {error}")
+                            self.stats["errors"] += 1
+                            continue
+                        
+                        status = "[SUSPICIOUS]" if is_suspicious else "[DUPLICATE]" if is_duplicate else "Moved:"
+                        print(f"{status} {file_path.name} -> {category}/")
+                        
+                        # Persist each move to the undo log as it happens
+                        move_info = {
+                            "original_path": file_path.path,
+                            "new_path": destination,
+                            "filename": file_path.name,
+                            "category": category,
+                            "suspicious": is_suspicious,
+                            "duplicate": is_duplicate
+                        }
+                        try:
+                            self._append_undo_record(move_info)
+                        except OSError as e:
+                            self.logger.error("Failed to save undo data: %s", e)
+                        self.stats["moved"] += 1
+            finally:
+                self._close_undo_log()
+        
         # Generate and save report
         if not dry_run:
             report = self.generate_report(file_stats)
@@ -779,78 +1047,83 @@ class SimpleFileOrganizer:
                 print(f"💾 Space that can be saved by removing duplicates: {space_mb:.2f} MB")
             
             if self.stats["moved"] > 0:
-                self.save_undo_data()
                 print(f"📝 Organization complete! Use --undo to reverse changes.")
         
         return True
 
     def undo_organization(self, dry_run=False, progress_callback=None):
         """Undo the last file organization."""
-        if hasattr(self, 'logger'):
-            self.logger.info(f"Starting undo operation{' (DRY RUN)' if dry_run else ''}")
+        self.logger.info("Starting undo operation%s", ' (DRY RUN)' if dry_run else '')
+        
+        # Records are streamed from the undo log; only the count is taken up front
+        try:
+            total = self._count_undo_entries()
+        except Exception as e:
+            self.logger.error("Failed to load undo data: %s", e)
+            total = None
         
-        if not self.load_undo_data():
+        if total is None:
             print("No undo data found. Nothing to undo.")
             return False
         
-        if not self.undo_data:
+        if not total:
             print("No undo data available. Nothing to undo.")
             return False
         
-        print(f"Found {len(self.undo_data)} files to undo")
+        print(f"Found {total} files to undo")
         print("-" * 50)
         
         undo_stats = {"moved": 0, "errors": 0}
         
-        for i, move_info in enumerate(self.undo_data, 1):
+        for i, move_info in enumerate(self.iter_undo_entries(), 1):
             if progress_callback:
                 try:
                     filename = move_info.get('filename', 'unknown')
-                    progress_callback(i, len(self.undo_data), filename)
+                    progress_callback(i, total, filename)
                 except Exception:
                     pass
             
             try:
-                original_path = Path(move_info["original_path"])
-                new_path = Path(move_info["new_path"])
+                original_path = move_info["original_path"]
+                new_path = move_info["new_path"]
+                new_name = os.path.basename(new_path)
+                original_dir_name = os.path.basename(os.path.dirname(original_path))
                 
                 if dry_run:
                     status = "[SUSPICIOUS]" if move_info.get('suspicious') else "[DRY RUN]"
-                    print(f"{status} {new_path.name} -> {original_path.parent.name}/")
-                    if hasattr(self, 'logger'):
-                        self.logger.info(f"{status} Would undo: {new_path.name} -> {original_path.parent.name}/")
+                    print(f"{status} {new_name} -> {original_dir_name}/")
+                    self.logger.info("%s Would undo: %s -> %s/", status, new_name, original_dir_name)
                 else:
-                    if not new_path.exists():
-                        print(f"Warning: {new_path.name} not found in {move_info['category']}/ - skipping")
-                        if hasattr(self, 'logger'):
-                            self.logger.warning(f"File not found for undo: {new_path}")
+                    if not os.path.exists(new_path):
+                        print(f"Warning: {new_name} not found in {move_info['category']}/ - skipping")
+                        self.logger.warning("File not found for undo: %s", new_path)
                         continue
                     
-                    if original_path.exists():
-                        print(f"Warning: {original_path.name} already exists in original location - skipping")
-                        if hasattr(self, 'logger'):
-                            self.logger.warning(f"Original location occupied: {original_path}")
+                    if os.path.exists(original_path):
+                        print(f"Warning: {os.path.basename(original_path)} already exists in original location - skipping")
+                        self.logger.warning("Original location occupied: %s", original_path)
                         continue
                     
-                    shutil.move(str(new_path), str(original_path))
+                    self._move_file(new_path, original_path)
                     status = "[RESTORED]" if move_info.get('suspicious') else "Undone:"
-                    print(f"{status} {new_path.name} -> {original_path.parent.name}/")
-                    if hasattr(self, 'logger'):
-                        self.logger.info(f"{status} {new_path.name} -> {original_path.parent.name}/")
+                    # Same text for the console and the log; format it once
+                    line = f"{status} {new_name} -> {original_dir_name}/"
+                    print(line)
+                    self.logger.info(line)
                     undo_stats["moved"] += 1
                     
             except Exception as e:
-                print(f"Error undoing {move_info.get('filename', 'unknown')}: {e}")
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Error undoing {move_info.get('filename', 'unknown')}: {e}")
+                line = f"Error undoing {move_info.get('filename', 'unknown')}: {e}"
+                print(line)
+                self.logger.error(line)
                 undo_stats["errors"] += 1
         
         if not dry_run:
+            summary = f"Undo Summary: {undo_stats['moved']} files moved back, {undo_stats['errors']} errors"
             print("-" * 50)
-            print(f"Undo Summary: {undo_stats['moved']} files moved back, {undo_stats['errors']} errors")
-            if hasattr(self, 'logger'):
-                self.logger.info("-" * 50)
-                self.logger.info(f"Undo Summary: {undo_stats['moved']} files moved back, {undo_stats['errors']} errors")
+            print(summary)
+            self.logger.info("-" * 50)
+            self.logger.info(summary)
             
             if undo_stats["moved"] > 0:
                 self.clear_undo_data()
@@ -859,24 +1132,44 @@ class SimpleFileOrganizer:
         return True
 
 
+def _classify_log_line(text):
+    """Return the log display tag (color category) for a line of log text."""
+    if "ERROR" in text or "CRITICAL" in text:
+        return "ERROR"
+    elif "WARNING" in text or "SUSPICIOUS" in text or "⚠️" in text:
+        return "WARNING"
+    elif "✅" in text or "SUCCESS" in text or "completed successfully" in text:
+        return "SUCCESS"
+    elif "SUSPICIOUS" in text or "malware" in text.lower():
+        return "SUSPICIOUS"
+    elif "DUPLICATE" in text or "duplicate" in text.lower():
+        return "DUPLICATE"
+    return "INFO"
+
+
 class TkTextHandler(logging.Handler):
     """Logging handler that writes log records to a Tkinter Text widget via a queue."""
-    def __init__(self, message_queue: "queue.Queue[str]"):
+    def __init__(self, message_queue: "deque[tuple[str, str]]"):
         super().__init__()
         self.message_queue = message_queue
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            self.message_queue.put(msg + "\n")
+            msg = self.format(record) + "\n"
+            # Classify on the emitting (worker) thread so the GUI only inserts
+            self.message_queue.append((msg, _classify_log_line(msg)))
         except Exception:
             pass
 
 
 class FileOrganizerGUI:
     """Enhanced professional GUI with advanced features."""
+
+    # Progress text emoji per action; anything else falls back to "⚡"
+    _ACTION_EMOJI = {"Analyzing": "🔍", "Organizing": "🗂️", "Restoring": "↩️"}
+
     def __init__(self):
-        if tk is None:
+        if not _load_tkinter():
             raise RuntimeError("Tkinter is not available in this environment.")
 
         # Initialize DnD if available
@@ -935,7 +1228,9 @@ class FileOrganizerGUI:
         self.style.theme_use('clam')
         self._configure_styles()
 
-        self.message_queue: "queue.Queue[str]" = queue.Queue()
+        # deque.append/popleft are atomic in CPython, and the Tk thread is the only
+        # consumer, so no lock is needed between worker threads and the poller
+        self.message_queue: "deque[tuple[str, str]]" = deque()
         self.gui_handler = TkTextHandler(self.message_queue)
         self.gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
@@ -949,6 +1244,9 @@ class FileOrganizerGUI:
         # Animation and progress tracking
         self.animation_running = False
         self.progress_animation_id = None
+        self._last_progress_ts = 0.0
+        self._progress_every = 32
+        self._last_progress_color = None
         
         # Statistics and analytics
         self.file_stats = {}
@@ -990,6 +1288,9 @@ class FileOrganizerGUI:
             'text': theme_colors['text'],
             'border': theme_colors['border']
         })
+        # Plain attributes for colors read by event callbacks (one lookup instead of two)
+        self._c_bg = self.colors['bg']
+        self._c_warning = self.colors['warning']
 
     def toggle_theme(self):
         """Toggle between light and dark themes."""
@@ -1019,7 +1320,7 @@ class FileOrganizerGUI:
 
     def _on_drop_leave(self, event):
         """Handle drag leave."""
-        self.root.configure(bg=self.colors['bg'])
+        self.root.configure(bg=self._c_bg)
 
     def _on_drop(self, event):
         """Handle file/folder drop."""
@@ -1029,7 +1330,7 @@ class FileOrganizerGUI:
             if Path(folder_path).is_dir():
                 self.dir_var.set(folder_path)
                 messagebox.showinfo("📂 Folder Added", f"Directory set to:\n{folder_path}")
-        self.root.configure(bg=self.colors['bg'])
+        self.root.configure(bg=self._c_bg)
 
     def start_progress_animation(self):
         """Start smooth progress bar animation."""
@@ -1176,7 +1477,6 @@ class FileOrganizerGUI:
                 organizer = self.organizer_instance
             else:
                 # Create a temporary organizer for saving categories
-                from pathlib import Path
                 try:
                     organizer = SimpleFileOrganizer(str(Path.cwd()))
                 except Exception as e:
@@ -1215,7 +1515,6 @@ class FileOrganizerGUI:
                 categories = self.organizer_instance.file_categories
             else:
                 # Create a temporary organizer to get default categories
-                from pathlib import Path
                 temp_organizer = SimpleFileOrganizer(str(Path.cwd()))
                 categories = temp_organizer.file_categories
             
@@ -1270,7 +1569,6 @@ class FileOrganizerGUI:
             if hasattr(self, 'organizer_instance') and self.organizer_instance:
                 organizer = self.organizer_instance
             else:
-                from pathlib import Path
                 try:
                     organizer = SimpleFileOrganizer(str(Path.cwd()))
                 except Exception as e:
@@ -1278,19 +1576,11 @@ class FileOrganizerGUI:
                     return
             
             if organizer and organizer.db_connection:
-                try:
-                    cursor = organizer.db_connection.cursor()
-                    cursor.execute("DELETE FROM custom_categories WHERE name = ?", (category_name,))
-                    organizer.db_connection.commit()
-                    
-                    # Remove from in-memory categories
-                    if category_name in organizer.file_categories:
-                        del organizer.file_categories[category_name]
-                    
+                if organizer.delete_custom_category(category_name):
                     messagebox.showinfo("✅ Success", f"Category '{category_name}' deleted successfully!")
                     load_categories()
-                except Exception as e:
-                    messagebox.showerror("❌ Error", f"Failed to delete category: {e}")
+                else:
+                    messagebox.showerror("❌ Error", "Failed to delete category. See the log for details.")
             else:
                 messagebox.showerror("❌ Error", "Database connection not available.")
         
@@ -1623,10 +1913,12 @@ class FileOrganizerGUI:
         ttk.Button(advanced_buttons, text="🏷️ Categories", 
                   command=self.show_custom_categories_window, style='Primary.TButton').pack(side=tk.LEFT, padx=(0, 10))
 
-        # Notification bar for malware/duplicate alerts
+        # Notification bar for malware/duplicate alerts, overlaid with place() so
+        # showing/hiding it never forces main_container to repack its children
         self.notification_frame = tk.Frame(main_container, bg=self.colors['danger'], height=40)
-        self.notification_frame.pack(fill=tk.X, pady=(0, 15))
-        self.notification_frame.pack_forget()  # Initially hidden
+        self._notification_place = dict(in_=main_container, relx=0, rely=0, relwidth=1, height=40)
+        self.notification_frame.place(**self._notification_place)
+        self.notification_frame.place_forget()  # Initially hidden
         
         self.notification_text = tk.Label(self.notification_frame, text="", 
                                          bg=self.colors['danger'], fg='white',
@@ -1694,22 +1986,19 @@ class FileOrganizerGUI:
                                  font=("Segoe UI", 10), bg='#ecfdf5', fg=self.colors['success'])
         progress_label.pack(pady=15)
         
-        # Statistics display
-        stats_frame = tk.Frame(progress_info, bg='#ecfdf5')
+        # Statistics display (one gridded frame: title row above value row)
+        stats_frame = tk.Frame(progress_info, bg='#dcfce7', relief='solid', bd=1)
         stats_frame.pack(pady=(0, 10))
         
         self.stats_labels = {}
         stats_data = [("Files", "files_count"), ("Duplicates", "duplicates"), ("Suspicious", "suspicious"), ("Space Saved", "space_saved")]
         
         for i, (label, key) in enumerate(stats_data):
-            stat_frame = tk.Frame(stats_frame, bg='#dcfce7', relief='solid', bd=1)
-            stat_frame.pack(side=tk.LEFT, padx=5, pady=5)
-            
-            tk.Label(stat_frame, text=label, font=("Segoe UI", 8, "bold"), 
-                    bg='#dcfce7', fg=self.colors['success']).pack(pady=(5, 0))
-            self.stats_labels[key] = tk.Label(stat_frame, text="0", font=("Segoe UI", 12, "bold"), 
+            tk.Label(stats_frame, text=label, font=("Segoe UI", 8, "bold"), 
+                    bg='#dcfce7', fg=self.colors['success']).grid(row=0, column=i, padx=10, pady=(5, 0))
+            self.stats_labels[key] = tk.Label(stats_frame, text="0", font=("Segoe UI", 12, "bold"), 
                                             bg='#dcfce7', fg=self.colors['dark'])
-            self.stats_labels[key].pack(pady=(0, 5), padx=10)
+            self.stats_labels[key].grid(row=1, column=i, padx=10, pady=(0, 5))
         
         # Enhanced progress bar with green gradient effect
         progress_container = tk.Frame(progress_inner, bg='#f0fdf4', height=30, relief='solid', bd=1)
@@ -1757,6 +2046,7 @@ class FileOrganizerGUI:
 
         # Initialize variables
         self.backup_location = None
+        self._backup_dir = None
         self.current_backup_path = None
         self.current_backup_metadata = None
 
@@ -1796,35 +2086,38 @@ class FileOrganizerGUI:
         if self.undo_var.get():
             self.dry_run_var.set(False)
 
-    def _append_log(self, text: str):
-        """Append log text with enhanced color coding."""
+    def _enqueue(self, text: str, tag: str):
+        """Queue log text for display under an already-known tag."""
+        self.message_queue.append((text, tag))
+
+    def _append_log(self, entries):
+        """Append pre-tagged log text with enhanced color coding.
+
+        Consecutive entries with the same tag are joined into a single insert.
+        """
         self.log_text.configure(state=tk.NORMAL)
         
-        # Apply enhanced color coding based on log content
-        if "ERROR" in text or "CRITICAL" in text:
-            tag = "ERROR"
-        elif "WARNING" in text or "SUSPICIOUS" in text or "⚠️" in text:
-            tag = "WARNING"
-        elif "✅" in text or "SUCCESS" in text or "completed successfully" in text:
-            tag = "SUCCESS"
-        elif "SUSPICIOUS" in text or "malware" in text.lower():
-            tag = "SUSPICIOUS"
+        run_text = []
+        run_tag = None
+        for text, tag in entries:
             # Also show notification for malware detection
-            if "suspicious files detected" in text.lower():
+            if tag == "SUSPICIOUS" and "suspicious files detected" in text.lower():
                 try:
-                    import re
-                    match = re.search(r'(\d+)\s+suspicious', text)
+                    match = _SUSPICIOUS_COUNT_RE.search(text)
                     if match:
                         count = int(match.group(1))
-                        self.root.after(100, lambda: self._show_malware_notification(count))
+                        self.root.after(100, lambda count=count: self._show_malware_notification(count))
                 except:
                     pass
-        elif "DUPLICATE" in text or "duplicate" in text.lower():
-            tag = "DUPLICATE"
-        else:
-            tag = "INFO"
+            
+            if tag != run_tag and run_text:
+                self.log_text.insert(tk.END, "".join(run_text), run_tag)
+                run_text = []
+            run_tag = tag
+            run_text.append(text)
+        if run_text:
+            self.log_text.insert(tk.END, "".join(run_text), run_tag)
         
-        self.log_text.insert(tk.END, text, tag)
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
 
@@ -1840,29 +2133,32 @@ class FileOrganizerGUI:
         self.malware_count = count
         if count > 0:
             self.notification_text.config(text=f"⚠️ SECURITY ALERT: {count} suspicious/malware files detected and quarantined!")
-            self.notification_frame.pack(fill=tk.X, pady=(0, 15), before=self.log_text.master.master)
+            self.notification_frame.place(**self._notification_place)
+            self.notification_frame.lift()
             # Auto-hide after 10 seconds
             self.root.after(10000, self._hide_notification)
 
     def _show_duplicate_notification(self, count):
         """Show duplicate files notification."""
         if count > 0:
-            self.notification_frame.configure(bg=self.colors['warning'])
-            self.notification_text.configure(bg=self.colors['warning'])
+            self.notification_frame.configure(bg=self._c_warning)
+            self.notification_text.configure(bg=self._c_warning)
             self.notification_text.config(text=f"🔍 DUPLICATES FOUND: {count} duplicate files detected and organized!")
-            self.notification_frame.pack(fill=tk.X, pady=(0, 15), before=self.log_text.master.master)
+            self.notification_frame.place(**self._notification_place)
+            self.notification_frame.lift()
             # Auto-hide after 8 seconds
             self.root.after(8000, self._hide_notification)
 
     def _hide_notification(self):
         """Hide the notification bar."""
-        self.notification_frame.pack_forget()
+        self.notification_frame.place_forget()
 
     def _choose_backup_location(self):
         """Choose backup location."""
         path = filedialog.askdirectory(title="Select Backup Location")
         if path:
             self.backup_location = path
+            self._backup_dir = Path(path)
             messagebox.showinfo("✅ Backup Location Set", 
                               f"Backup will be saved to:\n{path}")
 
@@ -1873,15 +2169,13 @@ class FileOrganizerGUI:
         
         try:
             import zipfile
-            import json
-            from datetime import datetime
             
             # Create backup filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_filename = f"file_organizer_backup_{timestamp}.zip"
-            backup_path = Path(self.backup_location) / backup_filename
+            backup_path = self._backup_dir / backup_filename
             
-            self.message_queue.put(f"Creating backup: {backup_filename}\n")
+            self._enqueue(f"Creating backup: {backup_filename}\n", "INFO")
             
             # Store backup metadata
             backup_metadata = {
@@ -1895,25 +2189,26 @@ class FileOrganizerGUI:
             }
             
             with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                source_path = Path(source_dir)
-                files = [f for f in source_path.iterdir() if f.is_file() and not f.name.startswith('.')]
+                with os.scandir(source_dir) as it:
+                    files = [entry for entry in it if entry.is_file() and not entry.name.startswith('.')]
                 
-                for file_path in files:
-                    # Store file info in metadata
+                for entry in files:
+                    # Store file info in metadata; one stat call, cached on the entry
+                    file_stat = entry.stat()
                     file_info = {
-                        "original_path": str(file_path),
-                        "filename": file_path.name,
-                        "size": file_path.stat().st_size,
-                        "modified": file_path.stat().st_mtime
+                        "original_path": entry.path,
+                        "filename": entry.name,
+                        "size": file_stat.st_size,
+                        "modified": file_stat.st_mtime
                     }
                     backup_metadata["files_backed_up"].append(file_info)
                     
                     # Add file to backup
-                    zipf.write(file_path, file_path.name)
+                    zipf.write(entry.path, entry.name)
             
             # Save metadata as JSON file in backup directory
             metadata_filename = f"backup_metadata_{timestamp}.json"
-            metadata_path = Path(self.backup_location) / metadata_filename
+            metadata_path = self._backup_dir / metadata_filename
             
             with open(metadata_path, 'w') as f:
                 json.dump(backup_metadata, f, indent=2)
@@ -1922,12 +2217,12 @@ class FileOrganizerGUI:
             self.current_backup_path = backup_path
             self.current_backup_metadata = backup_metadata
             
-            self.message_queue.put(f"✅ Backup created successfully: {backup_path}\n")
-            self.message_queue.put(f"📋 Metadata saved: {metadata_path}\n")
+            self._enqueue(f"✅ Backup created successfully: {backup_path}\n", "SUCCESS")
+            self._enqueue(f"📋 Metadata saved: {metadata_path}\n", "INFO")
             return True
             
         except Exception as e:
-            self.message_queue.put(f"❌ Backup failed: {e}\n")
+            self._enqueue(f"❌ Backup failed: {e}\n", "ERROR")
             return False
 
     def _recover_from_backup(self):
@@ -1939,8 +2234,6 @@ class FileOrganizerGUI:
         
         try:
             import zipfile
-            import json
-            from pathlib import Path
             
             # Confirm recovery
             result = messagebox.askyesno("🔄 Recover from Backup", 
@@ -1950,7 +2243,7 @@ class FileOrganizerGUI:
             if not result:
                 return False
             
-            self.message_queue.put("🔄 Starting backup recovery...\n")
+            self._enqueue("🔄 Starting backup recovery...\n", "INFO")
             
             # Extract backup to original location
             with zipfile.ZipFile(self.current_backup_path, 'r') as zipf:
@@ -1960,7 +2253,7 @@ class FileOrganizerGUI:
                 for filename in file_list:
                     # Extract to original directory
                     zipf.extract(filename, self.current_backup_metadata["source_directory"])
-                    self.message_queue.put(f"✅ Recovered: {filename}\n")
+                    self._enqueue(f"✅ Recovered: {filename}\n", "SUCCESS")
             
             # Update metadata to track recovery
             if hasattr(self, 'current_backup_metadata'):
@@ -1969,30 +2262,29 @@ class FileOrganizerGUI:
                 
                 # Save updated metadata
                 metadata_filename = f"backup_metadata_{self.current_backup_metadata['timestamp']}.json"
-                metadata_path = Path(self.backup_location) / metadata_filename
+                metadata_path = self._backup_dir / metadata_filename
                 
                 with open(metadata_path, 'w') as f:
                     json.dump(self.current_backup_metadata, f, indent=2)
             
-            self.message_queue.put("✅ Backup recovery completed successfully!\n")
+            self._enqueue("✅ Backup recovery completed successfully!\n", "SUCCESS")
             messagebox.showinfo("✅ Recovery Complete", 
                               "All files have been recovered from backup!\n\n"
                               "Files restored to their original locations.")
             return True
             
         except Exception as e:
-            self.message_queue.put(f"❌ Recovery failed: {e}\n")
+            self._enqueue(f"❌ Recovery failed: {e}\n", "ERROR")
             messagebox.showerror("❌ Recovery Failed", f"Failed to recover from backup:\n{e}")
             return False
 
     def _poll_log_queue(self):
         """Poll log queue and update display."""
         try:
-            while True:
-                msg = self.message_queue.get_nowait()
-                self._append_log(msg)
-        except queue.Empty:
-            pass
+            if self.message_queue:
+                popleft = self.message_queue.popleft
+                batch = [popleft() for _ in range(len(self.message_queue))]
+                self._append_log(batch)
         finally:
             self.root.after(100, self._poll_log_queue)
 
@@ -2007,7 +2299,8 @@ class FileOrganizerGUI:
                                  "Please select a target directory to organize.")
             return
 
-        if not Path(directory).exists():
+        dir_path = Path(directory)
+        if not dir_path.exists():
             messagebox.showerror("❌ Invalid Directory", 
                                f"The selected directory does not exist:\n{directory}")
             return
@@ -2035,12 +2328,9 @@ class FileOrganizerGUI:
         self.current_operation = 'undo' if do_undo else 'organize'
         self.is_dry_run = dry_run
 
-        # Clear previous logs, reset progress, and hide notifications
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.delete("1.0", tk.END)
-        self.log_text.configure(state=tk.DISABLED)
+        # Clear previous logs (also hides notifications) and reset progress
+        self._clear_logs()
         self._reset_progress()
-        self._hide_notification()
 
         # Update UI state with enhanced styling and animations
         self.run_button.configure(state=tk.DISABLED)
@@ -2063,43 +2353,37 @@ class FileOrganizerGUI:
             try:
                 # Create backup if enabled
                 if create_backup and not do_undo and not dry_run:
-                    self.message_queue.put("💾 Creating backup before organizing...\n")
-                    if not self._create_backup(directory):
-                        self.message_queue.put("❌ Backup failed. Operation cancelled.\n")
+                    self._enqueue("💾 Creating backup before organizing...\n", "INFO")
+                    if not self._create_backup(dir_path):
+                        self._enqueue("❌ Backup failed. Operation cancelled.\n", "ERROR")
                         return
 
                 # Initialize organizer with database support
-                self.organizer_instance = SimpleFileOrganizer(directory)
+                self.organizer_instance = SimpleFileOrganizer(dir_path)
                 logger = logging.getLogger(__name__)
                 logger.addHandler(self.gui_handler)
                 
                 try:
+                    # Marshal progress onto the Tk thread with a bound method plus
+                    # arguments instead of allocating closures for every file
+                    marshal = self._marshal_progress
+                    after = self.root.after
+                    organizer = self.organizer_instance
+                    progress_due = self._progress_due
                     if do_undo:
                         def progress_callback(current, total, filename):
-                            def update_gui():
-                                self._update_progress(current, total, filename, "Restoring")
-                                # Update statistics in real-time
-                                if hasattr(self.organizer_instance, 'stats'):
-                                    self.root.after(0, lambda: self.update_statistics_display(self.organizer_instance.stats))
-                            self.root.after(0, update_gui)
+                            if progress_due(current, total):
+                                after(0, marshal, current, total, filename, "Restoring", dict(organizer.stats))
                         self.organizer_instance.undo_organization(dry_run=dry_run, progress_callback=progress_callback)
                     else:
                         sort_by = self.sort_by_var.get()
                         sort_order = self.sort_order_var.get()
-                        
+                        action = "Analyzing" if dry_run else "Organizing"
+
                         def progress_callback(current, total, filename):
-                            def update_gui():
-                                action = "Analyzing" if dry_run else "Organizing"
-                                self._update_progress(current, total, filename, action)
-                                # Update statistics in real-time
-                                if hasattr(self.organizer_instance, 'stats'):
-                                    self.root.after(0, lambda: self.update_statistics_display(self.organizer_instance.stats))
-                            self.root.after(0, update_gui)
-                        
-                        # Store file statistics for charts
-                        files = [f for f in Path(directory).iterdir() if f.is_file() and not f.name.startswith('.')]
-                        self.file_stats = self.organizer_instance.generate_file_statistics(files)
-                        
+                            if progress_due(current, total):
+                                after(0, marshal, current, total, filename, action, dict(organizer.stats))
+
                         self.organizer_instance.organize_files(
                             dry_run=dry_run, 
                             sort_by=sort_by, 
@@ -2108,6 +2392,8 @@ class FileOrganizerGUI:
                             progress_callback=progress_callback,
                             find_duplicates=find_duplicates
                         )
+                        # Reuse the statistics organize_files gathered from its own scan
+                        self.file_stats = self.organizer_instance.file_statistics
                         
                         # Show notifications for duplicates and malware
                         if hasattr(self.organizer_instance, 'stats'):
@@ -2123,7 +2409,7 @@ class FileOrganizerGUI:
                 finally:
                     logger.removeHandler(self.gui_handler)
             except Exception as e:
-                self.message_queue.put(f"💥 CRITICAL ERROR: {e}\n")
+                self._enqueue(f"💥 CRITICAL ERROR: {e}\n", "ERROR")
             finally:
                 self.root.after(0, self._on_worker_done)
 
@@ -2220,6 +2506,20 @@ class FileOrganizerGUI:
         self.is_dry_run = False
         self.malware_count = 0
 
+    def _progress_due(self, current, total):
+        """Return whether a progress tick should be drawn (called on the worker thread).
+
+        Ticks pass on every Nth file or after 50 ms, whichever comes first; the final
+        tick always passes so the bar reaches 100%. Skipped ticks never reach Tk, so
+        neither the progress bar nor the statistics labels redraw for them.
+        """
+        now = time.monotonic()
+        if (current != total and current % self._progress_every
+                and now - self._last_progress_ts < 0.05):
+            return False
+        self._last_progress_ts = now
+        return True
+
     def _update_progress(self, current, total, filename="", action="Processing"):
         """Enhanced progress updates with smooth animations."""
         if total > 0:
@@ -2230,14 +2530,7 @@ class FileOrganizerGUI:
             display_name = filename[:35] + "..." if len(filename) > 35 else filename
             
             # Enhanced progress text with emojis and colors
-            if action == "Analyzing":
-                emoji = "🔍"
-            elif action == "Organizing":
-                emoji = "🗂️"
-            elif action == "Restoring":
-                emoji = "↩️"
-            else:
-                emoji = "⚡"
+            emoji = self._ACTION_EMOJI.get(action, "⚡")
             
             self.progress_var.set(f"{emoji} {action}: {current}/{total} ({percentage:.1f}%) - {display_name}")
             
@@ -2249,16 +2542,25 @@ class FileOrganizerGUI:
             else:
                 progress_color = '#34d399'  # Light green
                 
-            # Update progress bar style dynamically
-            self.style.configure('Colored.Horizontal.TProgressbar', background=progress_color)
+            # Update progress bar style only when the color bucket changes, since
+            # reconfiguring a ttk style redraws every widget using it
+            if progress_color != self._last_progress_color:
+                self.style.configure('Colored.Horizontal.TProgressbar', background=progress_color)
+                self._last_progress_color = progress_color
         else:
             self.progress_bar['value'] = 0
             self.progress_var.set(f"{action} files...")
 
+    def _marshal_progress(self, current, total, filename, action, stats_snap):
+        """Apply a progress tick and statistics snapshot posted from the worker thread."""
+        self._update_progress(current, total, filename, action)
+        self.update_statistics_display(stats_snap)
+
     def _reset_progress(self):
         """Reset progress indicators with enhanced styling."""
         self.progress_bar['value'] = 0
         self.progress_var.set("🚀 Ready to organize files...")
+        self._last_progress_ts = 0.0
         self.malware_count = 0
 
     def run(self):
@@ -2284,74 +2586,79 @@ class FileOrganizerGUI:
         self.root.mainloop()
 
 
+_USAGE = """\
+🗂️  File Organizer 
+==================================================
+Usage: python file_organizer.py <directory> [options]
+
+Options:
+  --dry-run              Preview changes without moving files
+  --undo                 Undo last organization
+  --org-type TYPE        Organization type: type|date|size|extension
+  --sort-by FIELD        Sort by: name|date|size
+  --sort-order ORDER     Sort order: asc|desc
+  --backup LOCATION      Create a zip backup to LOCATION before organizing
+  --no-duplicates        Disable duplicate file detection
+
+Examples:
+  python file_organizer.py ~/Downloads --dry-run
+  python file_organizer.py ~/Downloads --org-type date
+  python file_organizer.py ~/Downloads --org-type size --sort-by date
+  python file_organizer.py ~/Downloads --backup ~/Backups
+  python file_organizer.py ~/Downloads --undo
+
+🛡️ Features:
+  • Advanced malware detection and quarantine
+  • Duplicate file detection with hash comparison
+  • Multiple organization methods (type/date/size/extension)
+  • Professional GUI with drag & drop support
+  • Real-time analytics and statistics
+  • PDF/Excel report export
+  • Custom file categories
+  • Comprehensive logging with color coding
+  • Safe undo functionality with full restore
+  • Automatic backup creation
+  • Theme support (light/dark)
+"""
+
+
+def _build_parser():
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(description="Organize files in a directory by type, date, size, or extension.")
+    parser.add_argument("directory", nargs="?", help="Directory to organize (omit to launch the GUI)")
+    parser.add_argument("--dry-run", action="store_true", help="Preview changes without moving files")
+    parser.add_argument("--undo", action="store_true", help="Undo last organization")
+    parser.add_argument("--org-type", choices=["type", "date", "size", "extension"], default="type",
+                        help="Organization type")
+    parser.add_argument("--sort-by", choices=["name", "date", "size"], default="name", help="Sort by")
+    parser.add_argument("--sort-order", choices=["asc", "desc"], default="asc", help="Sort order")
+    parser.add_argument("--backup", metavar="LOCATION",
+                        help="Create a zip backup to LOCATION before organizing")
+    parser.add_argument("--no-duplicates", action="store_true", help="Disable duplicate file detection")
+    return parser
+
+
 def main():
     """Enhanced main function with better CLI support."""
-    import sys
-    
-    # Enhanced CLI argument parsing
-    if len(sys.argv) >= 2:
-        directory = sys.argv[1]
-        dry_run = "--dry-run" in sys.argv
-        undo_mode = "--undo" in sys.argv
-        
-        # Parse organization type
-        org_type = "type"  # default
-        if "--org-type" in sys.argv:
-            try:
-                org_idx = sys.argv.index("--org-type")
-                if org_idx + 1 < len(sys.argv):
-                    org_type = sys.argv[org_idx + 1]
-                    if org_type not in ["type", "date", "size", "extension"]:
-                        print(f"Invalid organization type: {org_type}. Using 'type'.")
-                        org_type = "type"
-            except (ValueError, IndexError):
-                print("Invalid --org-type usage. Using 'type'.")
-        
-        # Parse sorting options
-        sort_by = "name"
-        sort_order = "asc"
-        
-        if "--sort-by" in sys.argv:
-            try:
-                sort_idx = sys.argv.index("--sort-by")
-                if sort_idx + 1 < len(sys.argv):
-                    sort_by = sys.argv[sort_idx + 1]
-                    if sort_by not in ["name", "date", "size"]:
-                        print(f"Invalid sort-by option: {sort_by}. Using 'name'.")
-                        sort_by = "name"
-            except (ValueError, IndexError):
-                print("Invalid --sort-by usage. Using 'name'.")
-        
-        if "--sort-order" in sys.argv:
-            try:
-                order_idx = sys.argv.index("--sort-order")
-                if order_idx + 1 < len(sys.argv):
-                    sort_order = sys.argv[order_idx + 1]
-                    if sort_order not in ["asc", "desc"]:
-                        print(f"Invalid sort-order option: {sort_order}. Using 'asc'.")
-                        sort_order = "asc"
-            except (ValueError, IndexError):
-                print("Invalid --sort-order usage. Using 'asc'.")
-        
-        # Optional CLI backup flag: --backup <directory>
-        backup_location = None
-        if "--backup" in sys.argv:
-            try:
-                bidx = sys.argv.index("--backup")
-                if bidx + 1 < len(sys.argv):
-                    backup_location = sys.argv[bidx + 1]
-                else:
-                    print("Invalid --backup usage. Provide backup directory path.")
-                    return
-            except (ValueError, IndexError):
-                print("Invalid --backup usage. Provide backup directory path.")
-                return
+    parser = _build_parser()
+    args = parser.parse_args()
 
-        # Parse duplicate detection option
-        find_duplicates = "--no-duplicates" not in sys.argv
-
-        # Run CLI version
-        organizer = SimpleFileOrganizer(directory)
+    if args.directory is None and len(sys.argv) > 1:
+        # Options only apply to command-line runs; don't drop them by opening the GUI
+        parser.error("a directory is required when command-line options are given")
+    
+    if args.directory is not None:
+        directory = args.directory
+        dry_run = args.dry_run
+        undo_mode = args.undo
+        org_type = args.org_type
+        sort_by = args.sort_by
+        sort_order = args.sort_order
+        backup_location = args.backup
+        find_duplicates = not args.no_duplicates
+
+        # Run CLI version; a dry run changes nothing, so it gets no log file
+        organizer = SimpleFileOrganizer(directory, enable_logging=not dry_run)
         
         print("🗂️  File Organizer ")
         print("=" * 50)
@@ -2392,10 +2699,13 @@ def main():
                         backup_name = f"file_organizer_backup_{ts}.zip"
                         backup_path = Path(backup_location) / backup_name
                         print(f"💾 Creating backup: {backup_path}")
-                        with _zip.ZipFile(backup_path, 'w', _zip.ZIP_DEFLATED) as zf:
-                            for f in Path(directory).iterdir():
-                                if f.is_file() and not f.name.startswith('.'):
-                                    zf.write(f, f.name)
+                        # Fastest deflate level: backups favour speed over size.
+                        # ZipFile.write already streams each file in chunks.
+                        with _zip.ZipFile(backup_path, 'w', _zip.ZIP_DEFLATED, compresslevel=1) as zf, \
+                                os.scandir(directory) as it:
+                            for entry in it:
+                                if not entry.name.startswith('.') and entry.is_file():
+                                    zf.write(entry.path, entry.name)
                         print(f"✅ Backup created: {backup_path}")
                     except Exception as e:
                         print(f"❌ Backup failed: {e}")
@@ -2419,7 +2729,7 @@ def main():
 
     else:
         # Launch GUI if no CLI args and Tkinter is available
-        if tk is not None:
+        if _load_tkinter():
             try:
                 app = FileOrganizerGUI()
                 app.run()
@@ -2428,35 +2738,7 @@ def main():
                 print(f"Failed to launch GUI: {e}")
         
         # Show enhanced CLI usage
-        print("🗂️  File Organizer ")
-        print("=" * 50)
-        print("Usage: python file_organizer.py <directory> [options]")
-        print("\nOptions:")
-        print("  --dry-run              Preview changes without moving files")
-        print("  --undo                 Undo last organization")
-        print("  --org-type TYPE        Organization type: type|date|size|extension")
-        print("  --sort-by FIELD        Sort by: name|date|size")
-        print("  --sort-order ORDER     Sort order: asc|desc")
-        print("  --backup LOCATION      Create a zip backup to LOCATION before organizing")
-        print("  --no-duplicates        Disable duplicate file detection")
-        print("\nExamples:")
-        print("  python file_organizer.py ~/Downloads --dry-run")
-        print("  python file_organizer.py ~/Downloads --org-type date")
-        print("  python file_organizer.py ~/Downloads --org-type size --sort-by date")
-        print("  python file_organizer.py ~/Downloads --backup ~/Backups")
-        print("  python file_organizer.py ~/Downloads --undo")
-        print("\n🛡️ Features:")
-        print("  • Advanced malware detection and quarantine")
-        print("  • Duplicate file detection with hash comparison")
-        print("  • Multiple organization methods (type/date/size/extension)")
-        print("  • Professional GUI with drag & drop support")
-        print("  • Real-time analytics and statistics")
-        print("  • PDF/Excel report export")
-        print("  • Custom file categories")
-        print("  • Comprehensive logging with color coding")
-        print("  • Safe undo functionality with full restore")
-        print("  • Automatic backup creation")
-        print("  • Theme support (light/dark)")
+        sys.stdout.write(_USAGE)
 
 
 if __name__ == "__main__":